@@ -6,9 +6,10 @@
 import time
 import datetime
 import calendar
+import functools
 import logging
 import re
-from typing import List, Union, Tuple, Optional  # mypy: type checks
+from typing import List, Match, Sequence, Union, Tuple, Optional  # mypy: type checks
 
 
 class TimestampParseException(Exception):
@@ -24,6 +25,68 @@ class TimestampParseException(Exception):
         return repr(self.value)
 
 
+def _is_ascii_digits(string: str) -> bool:
+    """
+    Returns True if string consists of the ASCII digits 0-9 only, unlike
+    str.isdigit() which is also True for other Unicode digits.
+    """
+    return bool(string) and not string.strip('0123456789')
+
+
+# OrgFormat.date() is a module-level function reading module-level tables so
+# that it needs no class attribute lookups per call:
+
+# weekday names written by OrgFormat.date(), indexed by datetime.weekday();
+# independent of the locale unlike strftime("%a")
+_ORGMODE_WEEKDAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+# formats for OrgFormat.date(), indexed by [show_time][inactive], applied to
+# (year, month, day, weekday name, repeater) or
+# (year, month, day, weekday name, hour, minute, repeater)
+_ORGMODE_DATE_FORMATS = (("<%04d-%02d-%02d %s%s>", "[%04d-%02d-%02d %s%s]"),
+                         ("<%04d-%02d-%02d %s %02d:%02d%s>", "[%04d-%02d-%02d %s %02d:%02d%s]"))
+
+
+def _date(tuple_date: Union[time.struct_time, datetime.datetime],
+          show_time: Optional[bool] = False,
+          inactive: Optional[bool] = False,
+          repeater_or_delay: Optional[str] = None) -> str:
+    """
+    Converts a given time.struct_time or datetime.datetime to an Org date- or time-stamp.
+
+    OrgFormat.date(time.strptime("2011-11-02T20:38:42", "%Y-%m-%dT%H:%M:%S"))
+    -> "<2011-11-02 Wed>"
+
+    OrgFormat.date(time.strptime("2011-11-02T20:38:42", "%Y-%m-%dT%H:%M:%S"), show_time=True)
+    -> "<2011-11-02 Wed 20:38>"
+
+    @param tuple_date: has to be of type time.struct_time or datetime.datetime
+    @param show_time: optional show time
+    @param inactive: (boolean) True: use inactive time-stamp; else use active
+    @param repeater_or_delay: string holding a repeater or a delay; e.g., '+2w' or '--5d'
+    """
+    # <YYYY-MM-DD hh:mm>
+    if type(tuple_date) is time.struct_time:
+        # the day of week of a struct_time is not trusted but recomputed
+        year, month, day, hour, minute = tuple_date[:5]
+        weekday = _ORGMODE_WEEKDAY_NAMES[datetime.date(year, month, day).weekday()]
+    else:
+        year, month, day = tuple_date.year, tuple_date.month, tuple_date.day
+        hour, minute = tuple_date.hour, tuple_date.minute
+        weekday = _ORGMODE_WEEKDAY_NAMES[tuple_date.weekday()]
+
+    repeater = ' ' + repeater_or_delay.strip() if repeater_or_delay else ''
+    if show_time:
+        return _ORGMODE_DATE_FORMATS[1][bool(inactive)] % (year, month, day, weekday,
+                                                           hour, minute, repeater)
+    return _ORGMODE_DATE_FORMATS[0][bool(inactive)] % (year, month, day, weekday, repeater)
+
+
+# shown as OrgFormat.date() by pydoc and in tracebacks:
+_date.__name__ = 'date'
+_date.__qualname__ = 'OrgFormat.date'
+
+
 class OrgFormat(object):
     """
     Utility library for providing functions to generate and modify Org
@@ -32,18 +95,35 @@ class OrgFormat(object):
 
     # FIXXME: this regular expression contains only English and German weekday names so far.
     # If this gets an issue, replace weekdays with 2-3 arbitrary characters or similar.
-    SINGLE_ORGMODE_TIMESTAMP = "([<\[]([12]\d\d\d)-([012345]\d)-([012345]\d) " + \
-        "(Mon|Tue|Wed|Thu|Fri|Sat|Sun|Mo|Di|Mi|Do|Fr|Sa|So|Mon|Die|Mit|Don|Fre|Sam|Son) " + \
-        "(([01]\d)|(20|21|22|23)):([012345]\d)[>\]])"
+    SINGLE_ORGMODE_TIMESTAMP = r"([<\[]([12]\d\d\d)-([012345]\d)-([012345]\d) " + \
+        r"(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun|Mo|Di|Mi|Do|Fr|Sa|So|Die|Mit|Don|Fre|Sam|Son) " + \
+        r"([01]\d|2[0-3]):([012345]\d)[>\]])"
+
+    # three-letter weekday names of SINGLE_ORGMODE_TIMESTAMP; used by
+    # the fixed-width fast path of orgmode_timestamp_to_datetime()
+    ORGMODE_WEEKDAYS = frozenset(('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun',
+                                  'Die', 'Mit', 'Don', 'Fre', 'Sam', 'Son'))
 
     ORGMODE_TIMESTAMP_REGEX = re.compile(SINGLE_ORGMODE_TIMESTAMP + "$")
 
     ORGMODE_TIMESTAMP_RANGE_REGEX = re.compile(
-        SINGLE_ORGMODE_TIMESTAMP + "-(-)?" + SINGLE_ORGMODE_TIMESTAMP + "$")
+        SINGLE_ORGMODE_TIMESTAMP + "--?" + SINGLE_ORGMODE_TIMESTAMP + "$")
+
+    # the tables of OrgFormat.date(); see above
+    ORGMODE_WEEKDAY_NAMES = _ORGMODE_WEEKDAY_NAMES
+    ORGMODE_DATE_FORMATS = _ORGMODE_DATE_FORMATS
+
+    # datetime.datetime.fromisoformat() is new in Python 3.7; without it,
+    # strdate() and parse_extended_iso_datetime() skip their fast path
+    HAS_FROMISOFORMAT = hasattr(datetime.datetime, 'fromisoformat')
 
     ISODATETIME_REGEX = re.compile('([12]\d\d\d-[012345]\d?-([012345]\d?))' +
                                    '([T ]((\d\d?[:.][012345]\d?)([:.][012345]\d?)?))?')
 
+    # same syntax as ISODATETIME_REGEX with one group per numeric field
+    ISODATETIME_FIELDS_REGEX = re.compile(r'([12]\d\d\d)-([012345]\d?)-([012345]\d?)' +
+                                          r'(?:[T ](\d\d?)[:.]([012345]\d?)(?:[:.]([012345]\d?))?)?')
+
     @staticmethod
     def orgmode_timestamp_to_datetime(orgtime: str) -> datetime.datetime:
         """
@@ -59,22 +139,47 @@ class OrgFormat(object):
         @param return: date time object
         """
 
-        assert isinstance(orgtime, str)
+        # fast path for the fixed-width layout '<YYYY-MM-DD Sun HH:MM>'
+        # which avoids the regular expression below:
+        if len(orgtime) == 22 and orgtime[0] in '<[' and orgtime[21] in '>]' and \
+                orgtime[1] in '12' and orgtime[5] == '-' and orgtime[8] == '-' and orgtime[11] == ' ' and \
+                orgtime[15] == ' ' and orgtime[18] == ':' and \
+                orgtime[12:15] in OrgFormat.ORGMODE_WEEKDAYS:
+            year_string = orgtime[1:5]
+            month_string = orgtime[6:8]
+            day_string = orgtime[9:11]
+            hour_string = orgtime[16:18]
+            minute_string = orgtime[19:21]
+            if _is_ascii_digits(year_string + month_string + day_string + hour_string + minute_string):
+                try:
+                    return datetime.datetime(int(year_string), int(month_string), int(day_string),
+                                             int(hour_string), int(minute_string), 0)
+                except ValueError:
+                    pass  # let the regular expression below decide
 
-        components = re.match(OrgFormat.ORGMODE_TIMESTAMP_REGEX, orgtime)
+        components = OrgFormat.ORGMODE_TIMESTAMP_REGEX.match(orgtime)
         if not components:
             raise TimestampParseException("string could not be parsed as " +
                                           "time-stamp of format \"<YYYY-MM-DD Sun " +
                                           "HH:MM>\" (including inactive ones): \"" +
                                           orgtime + "\"")
 
-        year = int(components.group(2))    # type: ignore  # FIXXME why
-        month = int(components.group(3))   # type: ignore  # FIXXME why
-        day = int(components.group(4))     # type: ignore  # FIXXME why
-        hour = int(components.group(6))    # type: ignore  # FIXXME why
-        minute = int(components.group(9))  # type: ignore  # FIXXME why
+        return OrgFormat._timestamp_match_to_datetime(components, 0)
 
-        return datetime.datetime(year, month, day, hour, minute, 0)
+    @staticmethod
+    def _timestamp_match_to_datetime(components: Match[str], offset: int) -> datetime.datetime:
+        """
+        Returns the datetime of an Org mode time-stamp matched by
+        ORGMODE_TIMESTAMP_REGEX (offset 0) or of one of the two
+        time-stamps matched by ORGMODE_TIMESTAMP_RANGE_REGEX (offset 0
+        for the first, offset 6 for the second one).
+        """
+        return datetime.datetime(int(components.group(offset + 2)),  # year
+                                 int(components.group(offset + 3)),  # month
+                                 int(components.group(offset + 4)),  # day
+                                 int(components.group(offset + 5)),  # hour
+                                 int(components.group(offset + 6)),  # minute
+                                 0)
 
     @staticmethod
     def apply_timedelta_to_org_timestamp(orgtime: str, deltahours: Union[int, float]) -> str:
@@ -97,28 +202,39 @@ class OrgFormat(object):
         @param return: '<YYYY-MM-DD Sun HH:MM>'
         """
 
-        assert isinstance(deltahours, (int, float))
-        assert isinstance(orgtime, str)
+        delta = datetime.timedelta(hours=deltahours)
+
+        # active ranges are split at their dashes so that both time-stamps
+        # use the fast path of orgmode_timestamp_to_datetime():
+        for separator in ('>--<', '>-<'):
+            if separator in orgtime:
+                begin, end = orgtime.split(separator, 1)
+                try:
+                    begin_datetime = OrgFormat.orgmode_timestamp_to_datetime(begin + '>')
+                    end_datetime = OrgFormat.orgmode_timestamp_to_datetime('<' + end)
+                except (TimestampParseException, ValueError):
+                    break  # malformed range; the regular expressions below report it for the whole orgtime
+                return _date(begin_datetime + delta, show_time=True, inactive=False) + \
+                    "--" + \
+                    _date(end_datetime + delta, show_time=True, inactive=False)
 
-        range_components = re.match(
-            OrgFormat.ORGMODE_TIMESTAMP_RANGE_REGEX, orgtime)
+        range_components = OrgFormat.ORGMODE_TIMESTAMP_RANGE_REGEX.match(orgtime)
 
         if range_components:
-            return OrgFormat.date(
-                OrgFormat.orgmode_timestamp_to_datetime(  # type: ignore  # FIXXME why? Argument 1 to "datetime" of "OrgFormat" has incompatible type "datetime"; expected "struct_time"
-                    range_components.groups(0)[0]) +  # type: ignore  # FIXXME why
-                datetime.timedelta(0, 0, 0, 0, 0, deltahours), show_time=True, inactive=False) + \
+            # inactive or mixed ranges; both time-stamps are already parsed by the range regex:
+            return _date(
+                OrgFormat._timestamp_match_to_datetime(range_components, 0) + delta,
+                show_time=True, inactive=False) + \
                 "--" + \
-                OrgFormat.date(
-                    OrgFormat.orgmode_timestamp_to_datetime(  # type: ignore  # FIXXME why? Argument 1 to "datetime" of "OrgFormat" has incompatible type "datetime"; expected "struct_time"
-                        range_components.groups(0)[10]) +  # type: ignore  # FIXXME why
-                    datetime.timedelta(0, 0, 0, 0, 0, deltahours), show_time=True, inactive=False)
+                _date(
+                    OrgFormat._timestamp_match_to_datetime(range_components, 6) + delta,
+                    show_time=True, inactive=False)
         else:
-            return OrgFormat.date(OrgFormat.orgmode_timestamp_to_datetime(orgtime) +  # type: ignore  # FIXXME why? Argument 1 to "datetime" of "OrgFormat" has incompatible type "datetime"; expected "struct_time"
-                                  datetime.timedelta(0, 0, 0, 0, 0, deltahours),
-                                  show_time=True, inactive=False)
+            return _date(OrgFormat.orgmode_timestamp_to_datetime(orgtime) + delta,
+                         show_time=True, inactive=False)
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def struct_time_to_datetime(tuple_date: time.struct_time) -> datetime.datetime:
         """
         Converts a time.struct_time argument to a datetime.datetime object
@@ -129,7 +245,6 @@ class OrgFormat(object):
         @param struct_time with potential wrong day of week
         """
 
-        assert isinstance(tuple_date, time.struct_time)
         return datetime.datetime(tuple_date.tm_year,
                                  tuple_date.tm_mon,
                                  tuple_date.tm_mday,
@@ -149,10 +264,10 @@ class OrgFormat(object):
         @param datetime object
         """
 
-        assert isinstance(tuple_date, datetime.datetime)
         return tuple_date.timetuple()
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def fix_struct_time_wday(tuple_date: time.struct_time) -> time.struct_time:
         """
         Correcting the given time.struct_time with the correct day of the week.
@@ -164,62 +279,71 @@ class OrgFormat(object):
         @param struct_time with potential false day of week
         """
 
-        assert isinstance(tuple_date, time.struct_time)
-        datetimestamp = OrgFormat.struct_time_to_datetime(tuple_date)
-        return time.struct_time((datetimestamp.year,
-                                 datetimestamp.month,
-                                 datetimestamp.day,
-                                 datetimestamp.hour,
-                                 datetimestamp.minute,
-                                 datetimestamp.second,
-                                 datetimestamp.weekday(),
+        weekday = datetime.date(tuple_date.tm_year,
+                                tuple_date.tm_mon,
+                                tuple_date.tm_mday).weekday()
+        return time.struct_time((tuple_date.tm_year,
+                                 tuple_date.tm_mon,
+                                 tuple_date.tm_mday,
+                                 tuple_date.tm_hour,
+                                 tuple_date.tm_min,
+                                 tuple_date.tm_sec,
+                                 weekday,
                                  0, 0))
 
+    date = staticmethod(_date)
+
     @staticmethod
-    def date(tuple_date: Union[time.struct_time, datetime.datetime],
-             show_time: Optional[bool] = False,
-             inactive: Optional[bool] = False,
-             repeater_or_delay: Optional[str] = None) -> str:
+    def bulk_date(tuple_dates: Sequence[Union[time.struct_time, datetime.datetime]],
+                  show_time: Optional[bool] = False,
+                  inactive: Optional[bool] = False) -> List[str]:
         """
-        Converts a given time.struct_time or datetime.datetime to an Org date- or time-stamp.
-
-        OrgFormat.date(time.strptime("2011-11-02T20:38:42", "%Y-%m-%dT%H:%M:%S"))
-        -> "<2011-11-02 Wed>"
+        Converts a sequence of time.struct_time or datetime.datetime to a list
+        of Org date- or time-stamps. Same as calling OrgFormat.date() for each
+        element.
 
-        OrgFormat.date(time.strptime("2011-11-02T20:38:42", "%Y-%m-%dT%H:%M:%S"), show_time=True)
-        -> "<2011-11-02 Wed 20:38>"
-
-        @param tuple_date: has to be of type time.struct_time or datetime.datetime
-        @param show_time: optional show time
-        @param inactive: (boolean) True: use inactive time-stamp; else use active
-        @param repeater_or_delay: string holding a repeater or a delay; e.g., '+2w' or '--5d'
-        """
-        # <YYYY-MM-DD hh:mm>
-        assert (tuple_date.__class__ ==
-                time.struct_time or tuple_date.__class__ == datetime.datetime)
+        A NumPy array of dtype datetime64 is accepted as well: its date and
+        time components are then computed for the whole array at once.
 
-        local_structtime = None  # : time.struct_time   # Variable annotation syntax is only supported in Python 3.6 and greater
+        OrgFormat.bulk_date([datetime.datetime(2011, 11, 2, 20, 38), datetime.datetime(2011, 11, 3, 9, 5)], show_time=True)
+        -> ['<2011-11-02 Wed 20:38>', '<2011-11-03 Thu 09:05>']
 
-        if isinstance(tuple_date, time.struct_time):
-            # fix day of week in struct_time
-            local_structtime = OrgFormat.fix_struct_time_wday(tuple_date)
-        else:
-            # convert datetime to struc_time
-            local_structtime = OrgFormat.datetime_to_struct_time(tuple_date)
+        OrgFormat.bulk_date(numpy.array(['2011-11-02T20:38', '2011-11-03T09:05'], dtype='datetime64[m]'))
+        -> ['<2011-11-02 Wed>', '<2011-11-03 Thu>']
 
-        result = ''
-        if show_time:
-            result = time.strftime("%Y-%m-%d %a %H:%M", local_structtime)
-        else:
-            result = time.strftime("%Y-%m-%d %a", local_structtime)
-            
-        if repeater_or_delay:
-            result += ' ' + repeater_or_delay.strip()
-            
-        if inactive:
-            return '[' + result + ']'
-        else:
-            return '<' + result + '>'
+        @param tuple_dates: elements have to be of type time.struct_time or datetime.datetime;
+                            or a numpy.ndarray of dtype datetime64
+        @param show_time: optional show time
+        @param inactive: (boolean) True: use inactive time-stamps; else use active
+        @param return: list of time-stamps in the order of tuple_dates
+        """
+        date_format = _ORGMODE_DATE_FORMATS[bool(show_time)][bool(inactive)]
+
+        dtype = getattr(tuple_dates, 'dtype', None)
+        if dtype is not None and dtype.kind == 'M':
+            # numpy.datetime64 array; NumPy itself is not imported since the
+            # array methods are all that is needed:
+            minutes = tuple_dates.astype('datetime64[m]')  # type: ignore
+            if (minutes != minutes).any():  # only NaT is unequal to itself
+                raise ValueError('NaT (not a time) can not be converted to an Org time-stamp')
+            days = minutes.astype('datetime64[D]')
+            months = days.astype('datetime64[M]')
+            years = days.astype('datetime64[Y]').astype(int) + 1970
+            month_numbers = months.astype(int) % 12 + 1
+            day_numbers = (days - months).astype(int) + 1
+            weekdays = (days.astype(int) + 3) % 7  # 1970-01-01 is a Thursday
+            minutes_of_day = (minutes - days).astype(int)
+            weekday_names = _ORGMODE_WEEKDAY_NAMES
+            fields = zip(years.tolist(), month_numbers.tolist(), day_numbers.tolist(),
+                         weekdays.tolist(), minutes_of_day.tolist())
+            if show_time:
+                return [date_format % (year, month, day, weekday_names[weekday],
+                                       minute_of_day // 60, minute_of_day % 60, '')
+                        for year, month, day, weekday, minute_of_day in fields]
+            return [date_format % (year, month, day, weekday_names[weekday], '')
+                    for year, month, day, weekday, minute_of_day in fields]
+
+        return [_date(tuple_date, show_time, inactive) for tuple_date in tuple_dates]
 
     @staticmethod
     def daterange(begin: time.struct_time, end: time.struct_time, show_time: bool = False, inactive: bool = False) -> str:
@@ -240,10 +364,8 @@ class OrgFormat(object):
         @param show_time: optional show time
         @param inactive: (boolean) True: use inactive time-stamps; else return active time-stamps
         """
-        assert isinstance(begin, time.struct_time)
-        assert isinstance(end, time.struct_time)
-        return "%s--%s" % (OrgFormat.date(begin, show_time=show_time, inactive=inactive),
-                           OrgFormat.date(end, show_time=show_time, inactive=inactive))
+        return "%s--%s" % (_date(begin, show_time=show_time, inactive=inactive),
+                           _date(end, show_time=show_time, inactive=inactive))
 
     @staticmethod
     def daterange_autodetect_time(begin_tuple: time.struct_time, end_tuple: time.struct_time, inactive: bool = False) -> str:
@@ -267,20 +389,45 @@ class OrgFormat(object):
         @param inactive: (boolean) True: use inactive time-stamps; else return active time-stamps
         """
 
-        if begin_tuple.tm_sec == 0 and \
-                begin_tuple.tm_min == 0 and \
-                begin_tuple.tm_hour == 0 and \
-                end_tuple.tm_sec == 0 and \
-                end_tuple.tm_min == 0 and \
-                end_tuple.tm_hour == 0:
+        # time-stamps as soon as any of both contains a time:
+        show_time = bool(begin_tuple.tm_hour or begin_tuple.tm_min or begin_tuple.tm_sec or
+                         end_tuple.tm_hour or end_tuple.tm_min or end_tuple.tm_sec)
+        return OrgFormat.daterange(begin_tuple, end_tuple,
+                                   show_time=show_time, inactive=inactive)
 
-            return OrgFormat.daterange(begin_tuple, end_tuple,
-                                       show_time=False, inactive=inactive)
-        else:
-            return OrgFormat.daterange(begin_tuple, end_tuple,
-                                       show_time=True, inactive=inactive)
+    @staticmethod
+    def _fromisoformat(datetime_string: str) -> Optional[datetime.datetime]:
+        """
+        Fast path for the strict ISO 8601 forms 'YYYY-MM-DD', 'YYYY-MM-DD[T ]HH:MM'
+        and 'YYYY-MM-DD[T ]HH:MM:SS' using datetime.datetime.fromisoformat().
+        Dots instead of colons within the time ('HH.MM.SS') are accepted as well.
+
+        Returns None for anything else so that the caller may fall back to
+        ISODATETIME_FIELDS_REGEX.
+        """
+        if not OrgFormat.HAS_FROMISOFORMAT:
+            return None
+
+        # fromisoformat() accepts more than that (week dates, basic format,
+        # fractional hours, arbitrary separators, ...), so check the layout first:
+        length = len(datetime_string)
+        if (length == 10 or
+                (length == 16 and datetime_string[13] in ':.') or
+                (length == 19 and datetime_string[13] in ':.' and datetime_string[16] in ':.')) and \
+                datetime_string[0] in '12' and datetime_string[4] == '-' and \
+                datetime_string[7] == '-' and datetime_string[10:11] in ('', 'T', ' '):
+            if length > 10 and '.' in datetime_string:
+                datetime_string = datetime_string[:13] + datetime_string[13:].replace('.', ':')
+            try:
+                result = datetime.datetime.fromisoformat(datetime_string)
+            except ValueError:
+                return None
+            if result.tzinfo is None:
+                return result
+        return None
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def strdate(date_string: str,
                 show_time: Optional[bool] = False,
                 inactive: Optional[bool] = False,
@@ -299,32 +446,32 @@ class OrgFormat(object):
         @param inactive: (boolean) True: use inactive time-stamp; else use active
         @param repeater_or_delay: string holding a repeater or a delay; e.g., '+2w' or '--5d'
         """
-        assert isinstance(date_string, str)
-        components = re.match(OrgFormat.ISODATETIME_REGEX, date_string)
-        if components:
-            if components.group(1) and components.group(5):
-                # found %Y-%m-%d %H:%M  ; don't care about the seconds
-                try:
-                    tuple_date = time.strptime(components.group(1) + 'T' +
-                                               components.group(5).replace(':', '.'),
-                                               "%Y-%m-%dT%H.%M")
-                    return OrgFormat.date(tuple_date, show_time=show_time, inactive=inactive, repeater_or_delay=repeater_or_delay)
-                except ValueError:
-                    raise TimestampParseException('The provided time-stamp string does not match ' +
-                                                  'the required format for %Y-%M-%D %H.%M(.%S) or ' +
-                                                  'is an invalid date/time.')
-            elif components.group(1):
-                # found %Y-%m-%d
-                tuple_date = time.strptime(components.group(1),
-                                           "%Y-%m-%d")
-                return OrgFormat.date(tuple_date, show_time=show_time, inactive=inactive, repeater_or_delay=repeater_or_delay)
-        else:
+        parsed_datetime = OrgFormat._fromisoformat(date_string)
+        if parsed_datetime is not None:
+            return _date(parsed_datetime, show_time=show_time, inactive=inactive, repeater_or_delay=repeater_or_delay)
+
+        # the regex splits the string into its numeric fields; datetime validates them:
+        components = OrgFormat.ISODATETIME_FIELDS_REGEX.match(date_string)
+        if not components:
             raise TimestampParseException('The provided date string does not match ' +
                                           'the required format for %Y-%M-%D (%H.%M(.%S)): ' +
                                           str(date_string))
-        assert False  # to satisfy mypy 0.740: "Missing return statement"
+        year, month, day, hour, minute, _ = components.groups()
+        if hour:
+            # found %Y-%m-%d %H:%M  ; don't care about the seconds
+            try:
+                parsed_datetime = datetime.datetime(int(year), int(month), int(day), int(hour), int(minute))
+            except ValueError:
+                raise TimestampParseException('The provided time-stamp string does not match ' +
+                                              'the required format for %Y-%M-%D %H.%M(.%S) or ' +
+                                              'is an invalid date/time.')
+        else:
+            # found %Y-%m-%d
+            parsed_datetime = datetime.datetime(int(year), int(month), int(day))
+        return _date(parsed_datetime, show_time=show_time, inactive=inactive, repeater_or_delay=repeater_or_delay)
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def parse_extended_iso_datetime(datetime_string: str) -> time.struct_time:
         """
         Parses any string containing date or time and return it as time.struct_time.
@@ -340,28 +487,21 @@ class OrgFormat(object):
 
         @param datetime_string: YYYY-MM-DD([T ]HH[.:]MM([.:]SS)?)?
         """
-        assert isinstance(datetime_string, str)
-
-        components = re.match(OrgFormat.ISODATETIME_REGEX, datetime_string)
-        if components:
-            if components.group(1) and components.group(5) and components.group(6):
-                # found %Y-%m-%d %H:%M:%S
-                return time.strptime(components.group(1) + 'T' +
-                                     components.group(4).replace(':', '.'),
-                                     "%Y-%m-%dT%H.%M.%S")
-            if components.group(1) and components.group(5):
-                # found %Y-%m-%d %H:%M
-                return time.strptime(components.group(1) + 'T' +
-                                     components.group(5).replace(':', '.'),
-                                     "%Y-%m-%dT%H.%M")
-            elif components.group(1):
-                # found %Y-%m-%d
-                return time.strptime(components.group(1), "%Y-%m-%d")
-        else:
+
+        parsed_datetime = OrgFormat._fromisoformat(datetime_string)
+        if parsed_datetime is not None:
+            return parsed_datetime.timetuple()
+
+        # the regex splits the string into its numeric fields; datetime validates them
+        # and its timetuple() equals the struct_time of time.strptime():
+        components = OrgFormat.ISODATETIME_FIELDS_REGEX.match(datetime_string)
+        if not components:
             raise TimestampParseException('The provided date string does not match ' +
                                           'the required format for %Y-%M-%D (%H.%M(.%S)): ' +
                                           str(datetime_string))
-        assert False  # to satisfy mypy 0.740: "Missing return statement"
+        year, month, day, hour, minute, second = components.groups('0')
+        return datetime.datetime(int(year), int(month), int(day),
+                                 int(hour), int(minute), int(second)).timetuple()
 
     @staticmethod
     def parse_basic_iso_datetime(datetime_string: str) -> time.struct_time:
@@ -378,11 +518,64 @@ class OrgFormat(object):
                                 YYYYMMDDTHHMMSS or
                                 YYYYMMDD
         """
-        assert isinstance(datetime_string, str)
         string_length = len(datetime_string)
 
-        # FIXXME: more intense checks on the datetime_string format using regex?
-
+        # fast path for the fixed-width layouts with ASCII digits: slice the
+        # components directly instead of using time.strptime(); the leap
+        # seconds 60 and 61, which datetime.datetime does not support, are
+        # added afterwards
+        leap_seconds = 0
+        try:
+            if string_length == 8 and _is_ascii_digits(datetime_string):
+                # YYYYMMDD
+                return datetime.datetime(int(datetime_string[0:4]),
+                                         int(datetime_string[4:6]),
+                                         int(datetime_string[6:8])).timetuple()
+            elif (string_length == 15 or (string_length == 16 and datetime_string[15] in 'Zz')) and \
+                    datetime_string[8] in 'Tt' and _is_ascii_digits(datetime_string[0:8]) and \
+                    _is_ascii_digits(datetime_string[9:15]):
+                # YYYYMMDDTHHMMSS or YYYYMMDDTHHMMSSZ
+                second = int(datetime_string[13:15])
+                if second in (60, 61):
+                    leap_seconds = second - 59
+                    second = 59
+                parsed_datetime = datetime.datetime(int(datetime_string[0:4]),
+                                                    int(datetime_string[4:6]),
+                                                    int(datetime_string[6:8]),
+                                                    int(datetime_string[9:11]),
+                                                    int(datetime_string[11:13]),
+                                                    second)
+                if string_length == 15:
+                    if leap_seconds:
+                        tuple_date = parsed_datetime.timetuple()
+                        return time.struct_time(tuple_date[:5] + (59 + leap_seconds,) + tuple_date[6:])
+                    return parsed_datetime.timetuple()
+                # UTC time-stamps get converted to local time:
+                return time.localtime(parsed_datetime.replace(tzinfo=datetime.timezone.utc).timestamp() +
+                                      leap_seconds)
+            elif string_length == 27 and \
+                    datetime_string[4] == '-' and datetime_string[7] == '-' and \
+                    datetime_string[10] in 'Tt' and datetime_string[13] == ':' and \
+                    datetime_string[16] == ':' and datetime_string[19] == '.' and \
+                    _is_ascii_digits(datetime_string[0:4] + datetime_string[5:7] + datetime_string[8:10] +
+                                     datetime_string[11:13] + datetime_string[14:16] + datetime_string[17:19]):
+                # 2011-11-02T14:48:54.908371Z
+                second = int(datetime_string[17:19])
+                if second in (60, 61):
+                    leap_seconds = second - 59
+                    second = 59
+                parsed_datetime = datetime.datetime(int(datetime_string[0:4]),
+                                                    int(datetime_string[5:7]),
+                                                    int(datetime_string[8:10]),
+                                                    int(datetime_string[11:13]),
+                                                    int(datetime_string[14:16]),
+                                                    second)
+                return time.localtime(parsed_datetime.replace(tzinfo=datetime.timezone.utc).timestamp() +
+                                      leap_seconds)
+        except ValueError:
+            pass  # let time.strptime() below decide
+
+        # anything else, e.g. space-padded days, is left to time.strptime():
         try:
             if string_length == 16:
                 # YYYYMMDDTHHMMSSZ
@@ -408,8 +601,6 @@ class OrgFormat(object):
         except ValueError as e:
             raise TimestampParseException(e)
 
-        assert(False)  # dead code for assuring mypy that everything above is handled by a return or raising exception statement
-
     @staticmethod
     def link(link: str, description: Optional[str] = None, replacespaces: Optional[bool] = True) -> str:
         """
@@ -431,13 +622,13 @@ class OrgFormat(object):
         @param replacespaces: if True (default), spaces within link are being sanitized
         """
 
-        if replacespaces:
+        if replacespaces and " " in link:
             link = link.replace(" ", "%20")
 
         if description:
-            return "[[" + link + "][" + description + "]]"
+            return f"[[{link}][{description}]]"
         else:
-            return "[[" + link + "]]"
+            return f"[[{link}]]"
 
     @staticmethod
     def mailto_link(contact_mail_string: str) -> str:
@@ -464,19 +655,18 @@ class OrgFormat(object):
 
         delimiter = contact_mail_string.find("<")
         if delimiter != -1:
-            name = contact_mail_string[:delimiter].strip()
-            mail = contact_mail_string[delimiter + 1:][:-1].strip()
-            if delimiter == 0:
-                return OrgFormat.link("mailto:" + mail,
-                                      description=mail,
-                                      replacespaces=False)
-            return OrgFormat.link("mailto:" + mail,
-                                  description=name,
-                                  replacespaces=False)
+            closing = contact_mail_string.rfind(">")
+            if closing < delimiter:
+                closing = len(contact_mail_string)
+            mail = contact_mail_string[delimiter + 1:closing].strip()
+            name = contact_mail_string[:delimiter].strip() if delimiter else mail
         else:
-            return OrgFormat.link("mailto:" + contact_mail_string,
-                                  description=contact_mail_string,
-                                  replacespaces=False)
+            mail = name = contact_mail_string
+
+        # like link(): no description part for an empty description
+        if name:
+            return f"[[mailto:{mail}][{name}]]"
+        return f"[[mailto:{mail}]]"
 
     @staticmethod
     def newsgroup_link(newsgroup_string: str) -> str:
@@ -493,9 +683,7 @@ class OrgFormat(object):
         @param return: [[news:comp.emacs][comp.emacs]]
         """
         assert newsgroup_string
-        return OrgFormat.link("news:" + newsgroup_string,
-                              description=newsgroup_string,
-                              replacespaces=False)
+        return f"[[news:{newsgroup_string}][{newsgroup_string}]]"
 
     @staticmethod
     def hms_from_sec(sec: int) -> str:
@@ -509,14 +697,11 @@ class OrgFormat(object):
         @param return: h:mm:ss as string
         """
 
-        assert isinstance(sec, int)
-
         seconds = sec % 60
         minutes = (sec // 60) % 60
         hours = (sec // (60 * 60))
 
-        return str(hours) + ":" + str(minutes).zfill(2) + ":" + \
-            str(seconds).zfill(2)
+        return "%d:%02d:%02d" % (hours, minutes, seconds)
 
     @staticmethod
     def dhms_from_sec(sec: int) -> str:
@@ -535,19 +720,14 @@ class OrgFormat(object):
         @param return: xd h:mm:ss as string
         """
 
-        assert isinstance(sec, int)
-
         seconds = sec % 60
         minutes = (sec // 60) % 60
         hours = (sec // (60 * 60)) % 24
         days = (sec // (60 * 60 * 24))
 
         if days > 0:
-            daystring = str(days) + "d "
-        else:
-            daystring = ''
-        return daystring + str(hours) + ":" + str(minutes).zfill(2) + \
-            ":" + str(seconds).zfill(2)
+            return "%dd %d:%02d:%02d" % (days, hours, minutes, seconds)
+        return "%d:%02d:%02d" % (hours, minutes, seconds)
 
     @staticmethod
     def generate_heading(level: int,
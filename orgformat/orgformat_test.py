@@ -3,11 +3,17 @@
 # Time-stamp: <2019-12-29 11:59:19 vk>
 
 import unittest
+import calendar
 import time
 import datetime
 import os
 from orgformat import OrgFormat, TimestampParseException
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class TestOrgFormat(unittest.TestCase):
 
@@ -18,10 +24,31 @@ class TestOrgFormat(unittest.TestCase):
         self.assertEqual(OrgFormat.orgmode_timestamp_to_datetime(
             '[1980-12-31 Wed 23:59]'),
                          datetime.datetime(1980, 12, 31, 23, 59, 0, tzinfo=None))
+        self.assertEqual(OrgFormat.orgmode_timestamp_to_datetime(
+            '<1980-12-31 Mi 23:59>'),
+                         datetime.datetime(1980, 12, 31, 23, 59, 0, tzinfo=None))
         with self.assertRaises(TimestampParseException):
             OrgFormat.orgmode_timestamp_to_datetime('foobar')
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.orgmode_timestamp_to_datetime('<1980-12-31 Wed 24:00>')
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.orgmode_timestamp_to_datetime('<1980-12-31 Wed 2359>')
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.orgmode_timestamp_to_datetime('<0980-12-31 Wed 23:59>')
         with self.assertRaises(TimestampParseException):
             OrgFormat.orgmode_timestamp_to_datetime('<1980-12-31 23:59>')  # missing day of week
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.orgmode_timestamp_to_datetime('<1980-01-31 Wed ٢٣:40]')  # non-ASCII digits
+
+        # the anchored regex accepts one trailing newline, e.g. of lines read from a file:
+        self.assertEqual(OrgFormat.orgmode_timestamp_to_datetime(
+            '<1980-12-31 Wed 23:59>\n'),
+                         datetime.datetime(1980, 12, 31, 23, 59, 0, tzinfo=None))
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.orgmode_timestamp_to_datetime('<1980-12-31 Wed 23:59> trailing')
+        self.assertIsNone(OrgFormat.ORGMODE_TIMESTAMP_REGEX.match('<1980-12-31 Wed 23:59> trailing'))
+        self.assertIsNone(OrgFormat.ORGMODE_TIMESTAMP_RANGE_REGEX.match(
+            '<2020-01-01 Wed 01:30>--<2020-01-01 Wed 02:00> trailing'))
 
     def test_apply_timedelta_to_org_timestamp(self):
         self.assertEqual(OrgFormat.apply_timedelta_to_org_timestamp(
@@ -42,6 +69,22 @@ class TestOrgFormat(unittest.TestCase):
         self.assertEqual(OrgFormat.apply_timedelta_to_org_timestamp(
             '<2020-01-01 Wed 01:30>--<2020-01-01 Wed 02:00>', -2.5),
                          '<2019-12-31 Tue 23:00>--<2019-12-31 Tue 23:30>')
+        self.assertEqual(OrgFormat.apply_timedelta_to_org_timestamp(
+            '[2020-01-01 Wed 01:30]--[2020-01-01 Wed 02:00]', 1),
+                         '<2020-01-01 Wed 02:30>--<2020-01-01 Wed 03:00>')
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.apply_timedelta_to_org_timestamp('<2020-01-01 Wed 01:30>--<foo>', 1)
+        with self.assertRaises(TimestampParseException) as context:
+            OrgFormat.apply_timedelta_to_org_timestamp('<2020-01-41 Wed 01:30>--<2020-01-01 Wed 02:0>', 1)
+        self.assertIn('<2020-01-41 Wed 01:30>--<2020-01-01 Wed 02:0>', str(context.exception))
+        self.assertEqual(OrgFormat.apply_timedelta_to_org_timestamp(
+            '<2020-01-01 Wed 01:30>--<2020-01-01 Wed 02:00>\n', 1),
+                         '<2020-01-01 Wed 02:30>--<2020-01-01 Wed 03:00>')
+        self.assertEqual(OrgFormat.apply_timedelta_to_org_timestamp(
+            '[2020-01-01 Wed 01:30]--[2020-01-01 Wed 02:00]\n', 1),
+                         '<2020-01-01 Wed 02:30>--<2020-01-01 Wed 03:00>')
+        self.assertEqual(OrgFormat.apply_timedelta_to_org_timestamp('<2019-11-05 Tue 23:59>\n', 1),
+                         '<2019-11-06 Wed 00:59>')
 
     def test_struct_time_to_datetime(self):
         self.assertEqual(OrgFormat.struct_time_to_datetime(
@@ -102,6 +145,40 @@ class TestOrgFormat(unittest.TestCase):
                                         repeater_or_delay=' ++1m '),
                          '[2011-11-02 Wed 20:38 ++1m]')
 
+        ## testing datetime.datetime:
+        self.assertEqual(OrgFormat.date(datetime.datetime(2011, 11, 2, 20, 38, 42)),
+                         '<2011-11-02 Wed>')
+        self.assertEqual(OrgFormat.date(datetime.datetime(2011, 11, 2, 20, 38, 42), inactive=True, show_time=True,
+                                        repeater_or_delay='-3d'),
+                         '[2011-11-02 Wed 20:38 -3d]')
+
+    def test_bulk_date(self):
+
+        self.assertEqual(OrgFormat.bulk_date([]), [])
+
+        self.assertEqual(OrgFormat.bulk_date([time.strptime('2011-11-02T20:38', '%Y-%m-%dT%H:%M'),
+                                              time.struct_time([2013, 4, 3, 10, 54, 0, 0, 0, 0])]),
+                         ['<2011-11-02 Wed>', '<2013-04-03 Wed>'])
+
+        self.assertEqual(OrgFormat.bulk_date([datetime.datetime(2011, 11, 2, 20, 38),
+                                              datetime.datetime(2011, 11, 3, 9, 5)], show_time=True, inactive=True),
+                         ['[2011-11-02 Wed 20:38]', '[2011-11-03 Thu 09:05]'])
+
+    @unittest.skipUnless(numpy, 'NumPy is not installed')
+    def test_bulk_date_numpy(self):
+
+        dates = numpy.array(['1899-12-30T21:06', '1969-12-31T23:59', '1970-01-01T00:00',
+                             '2011-11-02T20:38:42', '2020-02-29T09:05'], dtype='datetime64[s]')
+        self.assertEqual(OrgFormat.bulk_date(dates, show_time=True),
+                         [OrgFormat.date(date, show_time=True) for date in dates.tolist()])
+        self.assertEqual(OrgFormat.bulk_date(dates.astype('datetime64[D]'), inactive=True),
+                         ['[1899-12-30 Sat]', '[1969-12-31 Wed]', '[1970-01-01 Thu]',
+                          '[2011-11-02 Wed]', '[2020-02-29 Sat]'])
+        with self.assertRaises(ValueError):
+            OrgFormat.bulk_date(numpy.array(['NaT'], dtype='datetime64[m]'), show_time=True)
+        with self.assertRaises(ValueError):
+            OrgFormat.bulk_date(numpy.array(['2011-11-02', 'NaT'], dtype='datetime64[D]'))
+
     def test_daterange(self):
 
         # NOTE: time.strptime() returns a time.struct_time
@@ -209,6 +286,23 @@ class TestOrgFormat(unittest.TestCase):
             OrgFormat.strdate('foo')
         with self.assertRaises(TimestampParseException):
             OrgFormat.strdate('2019-04-31 23:59')
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.strdate('2011-W44-4')  # ISO week date is not supported
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.strdate('3011-01-01')
+        self.assertEqual(OrgFormat.strdate('2011-11-03  23:59', show_time=True),
+                         '<2011-11-03 Thu 00:00>')  # only a single separator is accepted
+        # fields are restricted like in parse_extended_iso_datetime():
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.strdate('2011-11-7')
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.strdate('2011-11-9')
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.strdate('2011-1-7 3:48')
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.strdate('2011-11- 3')
+        self.assertEqual(OrgFormat.strdate('2011-11-03 23:9', show_time=True),
+                         '<2011-11-03 Thu 00:00>')
 
         self.assertEqual(OrgFormat.strdate('2011-11-30T21.06', show_time=True),
                          '<2011-11-30 Wed 21:06>')
@@ -263,6 +357,9 @@ class TestOrgFormat(unittest.TestCase):
         self.assertEqual(OrgFormat.parse_extended_iso_datetime("2011-1-2 3.4.5"),
                          time.strptime('2011-01-02 03.04.05', '%Y-%m-%d %H.%M.%S'))
 
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.parse_extended_iso_datetime('2011-11-7')
+
     def test_parse_basic_iso_datetime(self):
 
         os.environ['TZ'] = "Europe/Vienna"
@@ -292,12 +389,51 @@ class TestOrgFormat(unittest.TestCase):
             '<1899-12-30 Sat>'
         )
 
+        self.assertEqual(
+            OrgFormat.date(OrgFormat.parse_basic_iso_datetime('2011-11-02T14:48:54.908371Z'), True),
+            '<2011-11-02 Wed 15:48>'
+        )
+
+        self.assertEqual(OrgFormat.parse_basic_iso_datetime('20111219'),
+                         time.strptime('20111219', '%Y%m%d'))
+        self.assertEqual(OrgFormat.parse_basic_iso_datetime('20111219T205510Z'),
+                         time.localtime(calendar.timegm(time.strptime('20111219T205510Z', '%Y%m%dT%H%M%SZ'))))
+
+        # leap seconds as accepted by time.strptime():
+        self.assertEqual(OrgFormat.parse_basic_iso_datetime('20111219T205560'),
+                         time.strptime('20111219T205560', '%Y%m%dT%H%M%S'))
+        self.assertEqual(OrgFormat.parse_basic_iso_datetime('20111219T205560Z'),
+                         time.localtime(calendar.timegm(time.strptime('20111219T205560Z', '%Y%m%dT%H%M%SZ'))))
+        self.assertEqual(
+            OrgFormat.date(OrgFormat.parse_basic_iso_datetime('20111219T205560Z'), True),
+            '<2011-12-19 Mon 21:56>'
+        )
+        # lowercase 't' and 'z' as accepted by time.strptime():
+        self.assertEqual(OrgFormat.parse_basic_iso_datetime('20111219t205510'),
+                         time.strptime('20111219T205510', '%Y%m%dT%H%M%S'))
+        self.assertEqual(OrgFormat.parse_basic_iso_datetime('20111219T205510z'),
+                         time.localtime(calendar.timegm(time.strptime('20111219T205510Z', '%Y%m%dT%H%M%SZ'))))
+        self.assertEqual(
+            OrgFormat.date(OrgFormat.parse_basic_iso_datetime('2011-11-02t14:48:54.908371z'), True),
+            '<2011-11-02 Wed 15:48>'
+        )
+        # space-padded days as accepted by time.strptime():
+        self.assertEqual(OrgFormat.parse_basic_iso_datetime('201112 9'),
+                         time.strptime('201112 9', '%Y%m%d'))
+
+        # non-ASCII digits only where time.strptime() accepts them:
+        self.assertEqual(OrgFormat.parse_basic_iso_datetime('2011121٩'),
+                         time.strptime('2011121٩', '%Y%m%d'))
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.parse_basic_iso_datetime('2011١219')
         with self.assertRaises(TimestampParseException):
             OrgFormat.parse_basic_iso_datetime('foobar')
         with self.assertRaises(TimestampParseException):
             OrgFormat.parse_basic_iso_datetime('20111219x205510Z')
         with self.assertRaises(TimestampParseException):
             OrgFormat.parse_basic_iso_datetime('20111319')
+        with self.assertRaises(TimestampParseException):
+            OrgFormat.parse_basic_iso_datetime('20111219T205562')
 
     def test_link(self):
         self.assertEqual(OrgFormat.link('foo/bar'),
@@ -321,6 +457,14 @@ class TestOrgFormat(unittest.TestCase):
                          '[[mailto:Bob@example.com][Bob@example.com]]')
         self.assertEqual(OrgFormat.mailto_link('foo bar'),
                          '[[mailto:foo bar][foo bar]]')
+        self.assertEqual(OrgFormat.mailto_link('Bob Bobby <bob.bobby@example.com> '),
+                         '[[mailto:bob.bobby@example.com][Bob Bobby]]')
+        self.assertEqual(OrgFormat.mailto_link('Bob Bobby <bob.bobby@example.com'),
+                         '[[mailto:bob.bobby@example.com][Bob Bobby]]')
+        self.assertEqual(OrgFormat.mailto_link(''),
+                         '[[mailto:]]')
+        self.assertEqual(OrgFormat.mailto_link('<>'),
+                         '[[mailto:]]')
 
     def test_newsgroup_link(self):
 
@@ -343,6 +487,10 @@ class TestOrgFormat(unittest.TestCase):
         self.assertEqual(OrgFormat.dhms_from_sec(9999), '2:46:39')
         self.assertEqual(OrgFormat.dhms_from_sec(99999), '1d 3:46:39')
         self.assertEqual(OrgFormat.dhms_from_sec(12345678), '142d 21:21:18')
+        self.assertEqual(OrgFormat.dhms_from_sec(0), '0:00:00')
+        self.assertEqual(OrgFormat.dhms_from_sec(3600), '1:00:00')
+        self.assertEqual(OrgFormat.dhms_from_sec(86399), '23:59:59')
+        self.assertEqual(OrgFormat.dhms_from_sec(86400), '1d 0:00:00')
 
     def test_generate_heading(self):
 